@@ -6,28 +6,73 @@ A simple web interface that provides a one-click solution for transferring
 data between MySQL databases.
 """
 
-from flask import Flask, render_template, request, jsonify, flash, redirect, url_for
+from flask import Flask, Response, render_template, request, session, jsonify, flash, redirect, url_for
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
+import orjson
 import threading
 import os
-import sys
-from datetime import datetime
+import json
+import mmap
+import queue
+import time
+import uuid
+from datetime import datetime, timedelta
 import logging
-from db_transfer import DatabaseTransfer
+from log_config import LOG_FILE, configure_logging
 
-# Configure logging for Flask app
-logging.basicConfig(level=logging.INFO)
+# Configure logging for Flask app. db_transfer is imported lazily, so set it
+# up here first; transfer.log receives both app and transfer messages.
+configure_logging()
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that serializes with orjson"""
+    
+    option = orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Build the body as bytes directly instead of going through str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=str, option=self.option),
+                                        mimetype='application/json')
+
+
 # Create Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Compress HTML pages (including the log tail) and JSON responses. The
+# progress stream is left alone since buffering it would break SSE.
+app.config['COMPRESS_MIMETYPES'] = ['text/html', 'text/css', 'text/javascript', 'application/json']
+app.config['COMPRESS_STREAMS'] = False
+Compress(app)
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 
+# Size of the shared MySQL server connection pool
+POOL_SIZE = int(os.environ.get('POOL_SIZE', 10))
+
+# Seconds to cache database and table listings
+METADATA_TTL = int(os.environ.get('METADATA_TTL', 60))
+
+# Minutes to keep finished jobs in the registry
+JOB_RETENTION_MINUTES = int(os.environ.get('JOB_RETENTION_MINUTES', 15))
+
+CONFIG_FILE = 'config.json'
+
 # Global variables to track transfer status
 transfer_status = {
     'running': False,
     'last_result': None,
     'last_run': None,
-    'progress': None
+    'job_id': None
 }
 
 
@@ -43,6 +88,79 @@ class TransferProgress:
         self.start_time = None
         self.end_time = None
         self.result = None
+        self._subscribers = []
+        self._subscribers_lock = threading.Lock()
+        self._last_push = 0
+        self._push_pending = False
+        self._flush_timer = None
+        self._update_snapshot()
+    
+    def subscribe(self):
+        """Register a queue that receives a snapshot after every change"""
+        updates = queue.Queue()
+        with self._subscribers_lock:
+            self._subscribers.append(updates)
+        return updates
+    
+    def unsubscribe(self, updates):
+        """Stop sending snapshots to a queue returned by subscribe()"""
+        with self._subscribers_lock:
+            if updates in self._subscribers:
+                self._subscribers.remove(updates)
+    
+    def _update_snapshot(self):
+        """Rebuild the dictionary returned by to_dict() after a change"""
+        duration = None
+        if self.start_time and self.end_time:
+            duration = (self.end_time - self.start_time).total_seconds()
+        
+        self._static_dict = {
+            'status': self.status,
+            'message': self.message,
+            'current_table': self.current_table,
+            'tables_completed': self.tables_completed,
+            'total_tables': self.total_tables,
+            'duration_seconds': duration,
+            'result': self.result
+        }
+    
+    def _publish(self):
+        """Push the current state to every subscriber"""
+        self._update_snapshot()
+        snapshot = self.to_dict()
+        with self._subscribers_lock:
+            self._last_push = time.monotonic()
+            self._push_pending = False
+            for updates in self._subscribers:
+                updates.put(snapshot)
+    
+    def _publish_debounced(self):
+        """
+        Publish at most once every 100 ms
+        
+        Skipped updates are flushed by a timer 200 ms later so subscribers
+        always end up with the latest state.
+        """
+        if time.monotonic() - self._last_push > 0.1:
+            self._publish()
+            return
+        
+        self._update_snapshot()
+        with self._subscribers_lock:
+            self._push_pending = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(0.2, self._flush_pending)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _flush_pending(self):
+        """Publish an update that was held back by _publish_debounced()"""
+        with self._subscribers_lock:
+            self._flush_timer = None
+            pending = self._push_pending
+        
+        if pending:
+            self._publish()
     
     def reset(self):
         """Reset progress to initial state"""
@@ -54,6 +172,7 @@ class TransferProgress:
         self.start_time = None
         self.end_time = None
         self.result = None
+        self._update_snapshot()
     
     def start(self, total_tables):
         """Mark transfer as started"""
@@ -64,11 +183,13 @@ class TransferProgress:
         self.start_time = datetime.now()
         self.end_time = None
         self.result = None
+        self._publish()
     
     def update_table(self, table_name):
         """Update current table being processed"""
         self.current_table = table_name
         self.message = f'Processing table: {table_name}'
+        self._publish()
     
     def complete_table(self):
         """Mark current table as completed"""
@@ -76,6 +197,12 @@ class TransferProgress:
         if self.total_tables > 0:
             progress_pct = (self.tables_completed / self.total_tables) * 100
             self.message = f'Completed {self.tables_completed}/{self.total_tables} tables ({progress_pct:.1f}%)'
+        
+        # Bursts of small tables finish faster than clients can use updates
+        if self.tables_completed >= self.total_tables:
+            self._publish()
+        else:
+            self._publish_debounced()
     
     def finish(self, result):
         """Mark transfer as finished"""
@@ -89,87 +216,248 @@ class TransferProgress:
             self.message = 'Transfer completed with some errors'
         else:
             self.message = f'Transfer failed: {result["message"]}'
+        self._publish()
     
     def error(self, error_message):
         """Mark transfer as failed"""
         self.status = 'error'
         self.end_time = datetime.now()
         self.message = f'Transfer failed: {error_message}'
+        self._publish()
+    
+    def is_finished(self):
+        """Check whether the transfer has completed or failed"""
+        return self.status in ('completed', 'error')
     
     def to_dict(self):
         """Convert progress to dictionary for JSON serialization"""
-        duration = None
-        if self.start_time:
-            end = self.end_time or datetime.now()
-            duration = (end - self.start_time).total_seconds()
+        snapshot = self._static_dict.copy()
         
-        return {
-            'status': self.status,
-            'message': self.message,
-            'current_table': self.current_table,
-            'tables_completed': self.tables_completed,
-            'total_tables': self.total_tables,
-            'duration_seconds': duration,
-            'result': self.result
-        }
+        # Only a running transfer has a duration that changes between calls
+        if self.status == 'running' and self.start_time:
+            snapshot['duration_seconds'] = (datetime.now() - self.start_time).total_seconds()
+        
+        return snapshot
 
 
-# Global progress tracker
+# Progress of the most recently started job, shown on the main page
 progress = TransferProgress()
 
+# Registry of transfer jobs: {job_id: TransferProgress}
+JOBS = {}
+JOBS_LOCK = threading.Lock()
+_reaper_thread = None
 
-def run_transfer():
+# (database, table) pairs that unfinished jobs are writing to
+_active_targets = set()
+
+# Parsed config.json, reloaded only when the file's mtime changes
+_config_cache = {'mtime': 0, 'data': None, 'exists': False}
+_config_lock = threading.Lock()
+
+# Process-wide transfer instance, created lazily by get_transfer()
+_transfer_singleton = None
+_transfer_lock = threading.Lock()
+
+# Database/table metadata cache: {key: (timestamp, value)}
+_metadata_cache = {}
+_metadata_lock = threading.Lock()
+
+# Rendered main page: (key, html), where key is the data it was built from
+_index_cache = {'page': None}
+
+
+def load_config():
     """
-    Run the database transfer in a background thread
+    Load config.json, re-parsing it only when the file has changed
+    
+    Returns:
+        dict: Parsed configuration, or None if the file does not exist
+    """
+    with _config_lock:
+        try:
+            mtime = os.stat(CONFIG_FILE).st_mtime_ns
+        except FileNotFoundError:
+            _config_cache.update(mtime=0, data=None, exists=False)
+            return None
+        
+        if not _config_cache['exists'] or mtime != _config_cache['mtime']:
+            with open(CONFIG_FILE, 'r') as f:
+                data = json.load(f)
+            _config_cache.update(mtime=mtime, data=data, exists=True)
+            logger.info("Configuration loaded from %s", CONFIG_FILE)
+        
+        return _config_cache['data']
+
+
+def get_transfer():
+    """
+    Get the shared DatabaseTransfer instance
+    
+    The instance (and its server connection pool) is created on first use
+    and reused by every request instead of reconnecting each time. It is
+    rebuilt whenever config.json changes, closing the old instance's pool.
+    """
+    global _transfer_singleton
+    
+    config = load_config()
+    if config is None:
+        raise FileNotFoundError(f"Configuration file {CONFIG_FILE} not found")
+    
+    with _transfer_lock:
+        if _transfer_singleton is None or _transfer_singleton.config is not config:
+            # Imported here so pages that never touch MySQL don't load the driver
+            from db_transfer import DatabaseTransfer
+            if _transfer_singleton is not None:
+                _transfer_singleton.close_pool()
+            _transfer_singleton = DatabaseTransfer(config=config, pool_size=POOL_SIZE)
+            invalidate_metadata_cache()
+        return _transfer_singleton
+
+
+def _cached_metadata(key, loader):
+    """
+    Return a cached metadata value, calling loader() when missing or expired
+    
+    Empty results are not cached because the DatabaseTransfer listing
+    methods also return empty values when the query fails.
+    """
+    now = time.monotonic()
+    with _metadata_lock:
+        entry = _metadata_cache.get(key)
+        if entry and now - entry[0] < METADATA_TTL:
+            return entry[1]
+    
+    value = loader()
+    if value:
+        with _metadata_lock:
+            _metadata_cache[key] = (now, value)
+    return value
+
+
+def invalidate_metadata_cache():
+    """Drop all cached database and table listings"""
+    with _metadata_lock:
+        _metadata_cache.clear()
+
+
+def _cached_databases():
+    """Get the list of databases, cached for METADATA_TTL seconds"""
+    return _cached_metadata(('databases',), lambda: get_transfer().get_databases())
+
+
+def _cached_all_table_info(database_name):
+    """Get row counts for a database's tables, cached for METADATA_TTL seconds"""
+    return _cached_metadata(('table_info', database_name),
+                            lambda: get_transfer().get_all_table_info(database_name))
+
+
+def _reap_jobs():
+    """Periodically drop finished jobs older than JOB_RETENTION_MINUTES"""
+    while True:
+        time.sleep(60)
+        cutoff = datetime.now() - timedelta(minutes=JOB_RETENTION_MINUTES)
+        with JOBS_LOCK:
+            expired = [job_id for job_id, job in JOBS.items()
+                       if job.is_finished() and job.end_time < cutoff]
+            for job_id in expired:
+                del JOBS[job_id]
+        if expired:
+            logger.info("Removed %s finished jobs from the registry", len(expired))
+
+
+def create_job(target=None):
+    """
+    Register a new transfer job
+    
+    The target check and the registration happen under one lock, so two
+    requests for the same target cannot both get through.
+    
+    Args:
+        target (tuple, optional): (database, table) the job writes to; only
+            one unfinished job may write to a given target
+    
+    Returns:
+        tuple: (job_id, TransferProgress) for the new job, or (None, None)
+            if another job is already writing to target
     """
-    global progress
+    global progress, _reaper_thread
     
+    job_id = uuid.uuid4().hex
+    job_progress = TransferProgress()
+    
+    with JOBS_LOCK:
+        if target is not None:
+            if target in _active_targets:
+                return None, None
+            _active_targets.add(target)
+        
+        JOBS[job_id] = job_progress
+        progress = job_progress
+        transfer_status['running'] = True
+        transfer_status['job_id'] = job_id
+        
+        # Start the reaper on first use so it runs in the serving process
+        if _reaper_thread is None:
+            _reaper_thread = threading.Thread(target=_reap_jobs, daemon=True)
+            _reaper_thread.start()
+    
+    return job_id, job_progress
+
+
+def get_job(job_id):
+    """Get the TransferProgress of a job, or None if it is unknown"""
+    with JOBS_LOCK:
+        return JOBS.get(job_id)
+
+
+def _record_job_result(result, target=None):
+    """Update the global transfer status after a job has finished"""
+    with JOBS_LOCK:
+        _active_targets.discard(target)
+        transfer_status['running'] = any(not job.is_finished() for job in JOBS.values())
+        transfer_status['last_result'] = result
+        transfer_status['last_run'] = datetime.now()
+
+
+def run_transfer(job_progress):
+    """
+    Run the database transfer in a background thread
+    
+    Args:
+        job_progress (TransferProgress): Progress tracker of the job
+    """
     try:
         logger.info("Starting database transfer in background thread")
-        progress.start(0)  # We'll update this when we know the table count
+        job_progress.reset()
         
-        # Create transfer instance
-        transfer = DatabaseTransfer()
+        # Get shared transfer instance
+        transfer = get_transfer()
         
-        # Get table count from config
+        # Start once the table count from config is known
         tables = transfer.config.get('tables', [])
-        progress.total_tables = len(tables)
-        progress.start(len(tables))
-        
-        # Custom logging to update progress
-        class ProgressHandler(logging.Handler):
-            def emit(self, record):
-                message = record.getMessage()
-                if 'Transferring table:' in message:
-                    table_name = message.split(': ')[1]
-                    progress.update_table(table_name)
-                elif 'Data transfer completed for table' in message:
-                    progress.complete_table()
-        
-        # Add progress handler to logger
-        progress_handler = ProgressHandler()
-        transfer_logger = logging.getLogger('db_transfer')
-        transfer_logger.addHandler(progress_handler)
-        
-        # Run the transfer
-        result = transfer.transfer_all_tables()
+        job_progress.start(len(tables))
+        
+        # Run the transfer, reporting progress through callbacks
+        result = transfer.transfer_all_tables(
+            on_table_start=job_progress.update_table,
+            on_table_done=lambda table_name, table_result: job_progress.complete_table()
+        )
         
         # Update global status
-        progress.finish(result)
-        transfer_status['running'] = False
-        transfer_status['last_result'] = result
-        transfer_status['last_run'] = datetime.now()
+        invalidate_metadata_cache()
+        job_progress.finish(result)
+        _record_job_result(result)
         
-        logger.info(f"Transfer completed with status: {result['status']}")
+        logger.info("Transfer completed with status: %s", result['status'])
         
     except Exception as e:
         error_msg = str(e)
-        logger.error(f"Transfer failed with exception: {error_msg}")
+        logger.error("Transfer failed with exception: %s", error_msg)
         
-        progress.error(error_msg)
-        transfer_status['running'] = False
-        transfer_status['last_result'] = {'status': 'error', 'message': error_msg}
-        transfer_status['last_run'] = datetime.now()
+        invalidate_metadata_cache()
+        job_progress.error(error_msg)
+        _record_job_result({'status': 'error', 'message': error_msg})
 
 
 @app.route('/')
@@ -177,7 +465,7 @@ def index():
     """Main page with database and table selection dropdowns"""
     try:
         # Check if config file exists
-        config_exists = os.path.exists('config.json')
+        config_exists = load_config() is not None
         
         databases = []
         connection_error = None
@@ -185,69 +473,72 @@ def index():
         if config_exists:
             try:
                 # Get available databases
-                transfer = DatabaseTransfer()
-                databases = transfer.get_databases()
+                databases = _cached_databases()
             except Exception as e:
                 connection_error = str(e)
-                logger.error(f"Error getting databases: {e}")
+                logger.error("Error getting databases: %s", e)
         
-        return render_template('index.html', 
-                             config_exists=config_exists,
-                             databases=databases,
-                             connection_error=connection_error,
-                             transfer_status=transfer_status,
-                             progress=progress.to_dict())
+        # The page holds no live transfer state (the status card is loaded
+        # from /progress/fragment), so it only changes with these inputs.
+        # Pages with pending flash messages are rendered fresh.
+        key = (config_exists, tuple(databases), connection_error)
+        cacheable = not session.get('_flashes')
+        cached = _index_cache['page']
+        if cacheable and cached and cached[0] == key:
+            return cached[1]
+        
+        html = render_template('index.html', 
+                               config_exists=config_exists,
+                               databases=databases,
+                               connection_error=connection_error)
+        if cacheable:
+            _index_cache['page'] = (key, html)
+        return html
     except Exception as e:
-        logger.error(f"Error loading main page: {e}")
+        logger.error("Error loading main page: %s", e)
         flash(f'Error loading page: {str(e)}', 'error')
         return render_template('index.html', 
                              config_exists=False,
                              databases=[],
-                             connection_error=None,
-                             transfer_status=transfer_status,
-                             progress=progress.to_dict())
+                             connection_error=None)
+
+
+@app.route('/progress/fragment')
+def progress_fragment():
+    """Status card for the latest job, loaded by the main page"""
+    return render_template('_progress.html',
+                           transfer_status=transfer_status,
+                           progress=progress.to_dict())
 
 
 @app.route('/get_tables/<database_name>')
 def get_tables(database_name):
     """Get tables for a specific database as JSON"""
     try:
-        if not os.path.exists('config.json'):
+        if load_config() is None:
             return jsonify({'error': 'Configuration file not found'}), 400
         
-        transfer = DatabaseTransfer()
-        tables = transfer.get_tables(database_name)
-        
-        # Get additional info for each table
-        table_info = []
-        for table in tables:
-            info = transfer.get_table_info(database_name, table)
-            table_info.append({
-                'name': table,
-                'row_count': info.get('row_count', 0)
-            })
+        # Table names and row counts come from a single query so the
+        # worker thread is blocked on MySQL for one round trip only
+        info_map = _cached_all_table_info(database_name)
+        table_info = [
+            {'name': table, 'row_count': info.get('row_count', 0)}
+            for table, info in info_map.items()
+        ]
         
         return jsonify({'tables': table_info})
         
     except Exception as e:
-        logger.error(f"Error getting tables for database '{database_name}': {e}")
+        logger.error("Error getting tables for database '%s': %s", database_name, e)
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/transfer', methods=['POST'])
 def start_transfer():
-    """Start the database transfer process"""
-    global transfer_status, progress
-    
-    # Check if transfer is already running
-    if transfer_status['running']:
-        flash('Transfer is already in progress!', 'warning')
-        return redirect(url_for('index'))
-    
+    """Start a transfer job and return its id as JSON"""
     # Check if config file exists
-    if not os.path.exists('config.json'):
-        flash('Configuration file (config.json) not found! Please create it first.', 'error')
-        return redirect(url_for('index'))
+    if load_config() is None:
+        return jsonify({'error': 'Configuration file (config.json) not found! Please create it first.'}), 400
     
     # Get form data
     source_db = request.form.get('source_database')
@@ -255,60 +546,53 @@ def start_transfer():
     table_name = request.form.get('table_name')
     
     if not all([source_db, target_db, table_name]):
-        flash('Please select source database, target database, and table.', 'error')
-        return redirect(url_for('index'))
+        return jsonify({'error': 'Please select source database, target database, and table.'}), 400
     
     if source_db == target_db:
-        flash('Source and target databases cannot be the same.', 'error')
-        return redirect(url_for('index'))
+        return jsonify({'error': 'Source and target databases cannot be the same.'}), 400
+    
+    target = (target_db, table_name)
+    job_id, job_progress = create_job(target)
+    if job_id is None:
+        return jsonify({'error': f'A transfer into {target_db}.{table_name} is already in progress!'}), 409
+    
+    job_progress.start(1)  # Single table transfer
+    job_progress.update_table(table_name)
     
     try:
-        # Reset progress
-        progress.reset()
-        
-        # Mark as running
-        transfer_status['running'] = True
-        transfer_status['last_result'] = None
-        
         # Start transfer in background thread
         def run_single_table_transfer():
-            global progress, transfer_status
             try:
-                progress.start(1)  # Single table transfer
-                progress.update_table(table_name)
-                
-                transfer = DatabaseTransfer()
+                transfer = get_transfer()
                 result = transfer.transfer_single_table(source_db, target_db, table_name)
                 
-                progress.finish(result)
-                transfer_status['running'] = False
-                transfer_status['last_result'] = result
-                transfer_status['last_run'] = datetime.now()
+                invalidate_metadata_cache()
+                job_progress.finish(result)
+                _record_job_result(result, target)
                 
-                logger.info(f"Single table transfer completed: {result['status']}")
+                logger.info("Single table transfer completed: %s", result['status'])
                 
             except Exception as e:
                 error_msg = str(e)
-                logger.error(f"Single table transfer failed: {error_msg}")
+                logger.error("Single table transfer failed: %s", error_msg)
                 
-                progress.error(error_msg)
-                transfer_status['running'] = False
-                transfer_status['last_result'] = {'status': 'error', 'message': error_msg}
-                transfer_status['last_run'] = datetime.now()
+                invalidate_metadata_cache()
+                job_progress.error(error_msg)
+                _record_job_result({'status': 'error', 'message': error_msg}, target)
         
         thread = threading.Thread(target=run_single_table_transfer, daemon=True)
         thread.start()
         
-        flash(f'Data transfer started: {source_db}.{table_name} → {target_db}.{table_name}', 'info')
-        logger.info(f"Single table transfer initiated: {source_db}.{table_name} -> {target_db}.{table_name}")
+        logger.info("Single table transfer %s initiated: %s.%s -> %s.%s", job_id, source_db, table_name, target_db, table_name)
         
     except Exception as e:
-        transfer_status['running'] = False
         error_msg = f"Failed to start transfer: {str(e)}"
-        flash(error_msg, 'error')
+        job_progress.error(error_msg)
+        _record_job_result({'status': 'error', 'message': error_msg}, target)
         logger.error(error_msg)
+        return jsonify({'error': error_msg}), 500
     
-    return redirect(url_for('index'))
+    return jsonify({'job_id': job_id}), 202
 
 
 @app.route('/status')
@@ -320,16 +604,100 @@ def get_status():
     })
 
 
+@app.route('/status/<job_id>')
+def get_job_status(job_id):
+    """Get the progress of a single job as JSON"""
+    job_progress = get_job(job_id)
+    if job_progress is None:
+        return jsonify({'error': f'Unknown job: {job_id}'}), 404
+    
+    return jsonify({
+        'job_id': job_id,
+        'progress': job_progress.to_dict()
+    })
+
+
+@app.route('/cache/invalidate', methods=['POST'])
+def invalidate_cache():
+    """Flush cached database and table listings"""
+    invalidate_metadata_cache()
+    return jsonify({'message': 'Cache invalidated'})
+
+
+@app.route('/progress/stream', defaults={'job_id': None})
+@app.route('/progress/stream/<job_id>')
+def progress_stream(job_id):
+    """Stream a job's progress (default: the latest job) as Server-Sent Events"""
+    job_progress = progress if job_id is None else get_job(job_id)
+    if job_progress is None:
+        return jsonify({'error': f'Unknown job: {job_id}'}), 404
+    
+    def event_stream():
+        updates = job_progress.subscribe()
+        try:
+            # Send the current state first so the client never starts blank
+            snapshot = job_progress.to_dict()
+            yield f"data: {app.json.dumps(snapshot)}\n\n"
+            
+            # A finished job sends nothing more, so free the thread
+            while snapshot['status'] not in ('completed', 'error'):
+                try:
+                    snapshot = updates.get(timeout=30)
+                except queue.Empty:
+                    # Keep idle connections alive through proxies
+                    yield ": heartbeat\n\n"
+                    continue
+                yield f"data: {app.json.dumps(snapshot)}\n\n"
+        finally:
+            job_progress.unsubscribe(updates)
+    
+    return Response(event_stream(),
+                    mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+def tail_log(n=50):
+    """
+    Get the last n lines of transfer.log
+    
+    The log is memory-mapped for the duration of the call and lines are
+    located with rfind(), so the file is never split into a Python list of
+    lines. The mapping is closed before returning; an open mapping would
+    stop the log handler from rotating the file on Windows.
+    """
+    try:
+        with open(LOG_FILE, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files cannot be mapped
+                return ""
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = len(mm)
+                
+                # Walk back over n line breaks, ignoring the file's trailing newline
+                pos = end - 1 if mm[end - 1:end] == b'\n' else end
+                start = 0
+                for _ in range(n):
+                    newline = mm.rfind(b'\n', 0, pos)
+                    if newline == -1:
+                        start = 0
+                        break
+                    start = newline + 1
+                    pos = newline
+                
+                return mm[start:end].decode('utf-8', 'replace')
+    except FileNotFoundError:
+        return ""
+
+
 @app.route('/logs')
 def view_logs():
     """View transfer logs"""
     try:
-        log_content = ""
-        if os.path.exists('transfer.log'):
-            with open('transfer.log', 'r') as f:
-                # Get last 50 lines
-                lines = f.readlines()
-                log_content = ''.join(lines[-50:])
+        # Write out buffered records first, then get last 50 lines
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+        log_content = tail_log(50)
         
         return render_template('logs.html', log_content=log_content)
     
@@ -343,12 +711,11 @@ def view_config():
     """View current configuration"""
     try:
         config_content = ""
-        config_exists = False
+        config = load_config()
+        config_exists = config is not None
         
-        if os.path.exists('config.json'):
-            with open('config.json', 'r') as f:
-                config_content = f.read()
-            config_exists = True
+        if config_exists:
+            config_content = json.dumps(config, indent=2)
         
         return render_template('config.html', 
                              config_content=config_content,
@@ -370,7 +737,7 @@ def not_found_error(error):
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
-    logger.error(f"Internal server error: {error}")
+    logger.error("Internal server error: %s", error)
     return render_template('error.html', 
                          error_code=500,
                          error_message="Internal server error"), 500
@@ -382,11 +749,13 @@ if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     host = os.environ.get('HOST', '127.0.0.1')
     
-    logger.info(f"Starting Flask application on {host}:{port}")
-    logger.info(f"Debug mode: {debug_mode}")
+    logger.info("Starting Flask application on %s:%s", host, port)
+    logger.info("Debug mode: %s", debug_mode)
     
     # Create config.json template if it doesn't exist
-    if not os.path.exists('config.json'):
+    if not os.path.exists(CONFIG_FILE):
         logger.warning("config.json not found. Please create it using the provided template.")
     
-    app.run(host=host, port=port, debug=debug_mode)
+    # Serve requests on separate threads so slow MySQL calls and open
+    # progress streams don't block other clients
+    app.run(host=host, port=port, debug=debug_mode, threaded=True)
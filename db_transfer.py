@@ -9,38 +9,129 @@ Now supports dynamic database and table discovery.
 
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector import pooling
 import logging
 import json
+import os
+import queue
+import re
 import sys
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple, Optional
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('transfer.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+from log_config import configure_logging
+
+# Configure logging (a no-op when the web app already did)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# Hosts where wire compression is off unless asked for
+LOCAL_HOSTS = ('localhost', '127.0.0.1', '::1')
+
+# Tables copied at once by transfer_all_tables; past this the server or the
+# network is the bottleneck and extra workers only add contention
+MAX_PARALLEL_TABLES = 16
+
+# Upper bound for 'partition_parallelism'
+MAX_PARTITIONS = 16
+
+# Rows per INSERT batch, unless 'batch_size' is set in the config
+DEFAULT_BATCH_SIZE = 5000
+
+# executemany() sends a batch as one multi-row INSERT, which must fit in the
+# server's max_allowed_packet (4 MB by default on MySQL 5.7). Batches of wide
+# rows are shrunk to about this many bytes, leaving room for quoting.
+DEFAULT_BATCH_BYTES = 2 * 1024 * 1024
+
+# Batches written between commits. innodb_flush_log_at_trx_commit would cut
+# the per-commit fsync further, but it is a global setting and not safe to
+# change from a single transfer session.
+DEFAULT_COMMIT_EVERY = 10
+
+# Seconds the source server waits on a stalled row stream before dropping it
+DEFAULT_NET_WRITE_TIMEOUT = 600
+
+# Session checks switched off in bulk mode, restored afterwards
+BULK_MODE_SETTINGS = ('unique_checks', 'foreign_key_checks', 'sql_log_bin')
+
+
+def _safe_ident(name: str) -> str:
+    """
+    Quote a database, table or column name for use in SQL
+    
+    Identifiers can't be bound as parameters, so every name that reaches a
+    query goes through here. Backticks inside the name are doubled, which
+    keeps legal names such as "order-items" working.
+    
+    Args:
+        name (str): Identifier to quote
+        
+    Returns:
+        str: Backtick-quoted identifier
+        
+    Raises:
+        ValueError: If the name can't be a MySQL identifier
+    """
+    if not isinstance(name, str) or not name or len(name) > 64 or '\x00' in name:
+        raise ValueError(f"Invalid identifier: {name!r}")
+    return "`" + name.replace("`", "``") + "`"
+
 
 class DatabaseTransfer:
     """Handles data transfer between MySQL databases"""
     
-    def __init__(self, config_file: str = 'config.json'):
+    def __init__(self, config_file: str = 'config.json', pool_size: int = 5,
+                 config: Optional[Dict] = None):
         """
         Initialize the database transfer object
         
         Args:
             config_file (str): Path to the configuration file
+            pool_size (int): Number of pooled server connections
+            config (Dict, optional): Already loaded configuration; when given,
+                config_file is not read
         """
-        self.config = self._load_config(config_file)
+        self.config = config if config is not None else self._load_config(config_file)
+        self._local = threading.local()
         self.source_conn = None
         self.target_conn = None
-        self.server_conn = None
+        self.pool_size = max(1, min(pool_size, pooling.CNX_POOL_MAXSIZE))
+        self._server_pool = None
+        self._server_pool_lock = threading.Lock()
+        # Source table metadata and CREATE TABLE IF NOT EXISTS statements
+        # keyed by _table_key(); cleared when a transfer run starts
+        self._struct_cache: Dict[Tuple[str, int, str, str], List[Tuple]] = {}
+        self._pk_cache: Dict[Tuple[str, int, str, str], List[str]] = {}
+        self._create_statements: Dict[Tuple[str, int, str, str], str] = {}
+    
+    def __enter__(self) -> 'DatabaseTransfer':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._close_connections()
+        self.close_pool()
+    
+    # Source/target connections are per thread so one instance can run
+    # several transfers concurrently
+    @property
+    def source_conn(self) -> Optional[mysql.connector.MySQLConnection]:
+        return getattr(self._local, 'source_conn', None)
+    
+    @source_conn.setter
+    def source_conn(self, connection: Optional[mysql.connector.MySQLConnection]):
+        self._local.source_conn = connection
+    
+    @property
+    def target_conn(self) -> Optional[mysql.connector.MySQLConnection]:
+        return getattr(self._local, 'target_conn', None)
+    
+    @target_conn.setter
+    def target_conn(self, connection: Optional[mysql.connector.MySQLConnection]):
+        self._local.target_conn = connection
     
     def _load_config(self, config_file: str) -> Dict:
         """
@@ -55,15 +146,42 @@ class DatabaseTransfer:
         try:
             with open(config_file, 'r') as f:
                 config = json.load(f)
-            logger.info(f"Configuration loaded from {config_file}")
+            logger.info("Configuration loaded from %s", config_file)
             return config
         except FileNotFoundError:
-            logger.error(f"Configuration file {config_file} not found")
+            logger.error("Configuration file %s not found", config_file)
             raise
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in configuration file: {e}")
+            logger.error("Invalid JSON in configuration file: %s", e)
             raise
     
+    @staticmethod
+    def _connection_args(db_config: Dict) -> Dict:
+        """
+        Build the connect() arguments shared by every connection
+        
+        Wire compression defaults to on for remote hosts, where it cuts the
+        bytes sent; on a local server it only costs CPU.
+        
+        Args:
+            db_config (Dict): Database or server configuration parameters
+            
+        Returns:
+            Dict: Keyword arguments for mysql.connector.connect
+        """
+        host = db_config['host']
+        args = {
+            'host': host,
+            'port': db_config.get('port', 3306),
+            'user': db_config['user'],
+            'password': db_config['password'],
+            'compress': db_config.get('compress', host not in LOCAL_HOSTS),
+            'connection_timeout': db_config.get('connection_timeout', 10)
+        }
+        if 'ssl_disabled' in db_config:
+            args['ssl_disabled'] = db_config['ssl_disabled']
+        return args
+    
     def _create_connection(self, db_config: Dict) -> mysql.connector.MySQLConnection:
         """
         Create a MySQL database connection
@@ -76,19 +194,62 @@ class DatabaseTransfer:
         """
         try:
             connection = mysql.connector.connect(
-                host=db_config['host'],
-                port=db_config.get('port', 3306),
+                **self._connection_args(db_config),
                 database=db_config['database'],
-                user=db_config['user'],
-                password=db_config['password'],
-                autocommit=False
+                autocommit=False,
+                allow_local_infile=bool(self.config.get('load_data_infile', False))
             )
-            logger.info(f"Connected to database: {db_config['host']}:{db_config.get('port', 3306)}")
+            logger.info("Connected to database: %s:%s", db_config['host'], db_config.get('port', 3306))
             return connection
         except Error as e:
-            logger.error(f"Error connecting to MySQL database: {e}")
+            logger.error("Error connecting to MySQL database: %s", e)
             raise
     
+    def _open_connections(self, source_config: Dict, target_config: Dict):
+        """
+        Open this thread's source and target connections
+        
+        The settings are remembered so worker threads can open their own
+        connections to the same databases.
+        
+        Args:
+            source_config (Dict): Source database configuration
+            target_config (Dict): Target database configuration
+        """
+        self.source_conn = self._create_connection(source_config)
+        self.target_conn = self._create_connection(target_config)
+        self._local.db_configs = (source_config, target_config)
+    
+    def _table_key(self, table_name: str) -> Tuple[str, int, str, str]:
+        """
+        Key of a source table in the metadata caches
+        
+        Args:
+            table_name (str): Name of the table
+        
+        Returns:
+            Tuple[str, int, str, str]: Source host, port, database and table
+        """
+        db_configs = getattr(self._local, 'db_configs', None)
+        source_config = db_configs[0] if db_configs is not None else {}
+        return (source_config.get('host'), source_config.get('port', 3306),
+                self._source_database(), table_name)
+    
+    def _source_database(self) -> str:
+        """
+        Name of this thread's source database
+        
+        Read from the connection settings; connection.database would cost a
+        SELECT DATABASE() round trip on every call.
+        
+        Returns:
+            str: Database name
+        """
+        db_configs = getattr(self._local, 'db_configs', None)
+        if db_configs is None:
+            return self.source_conn.database
+        return db_configs[0]['database']
+    
     def connect_databases(self) -> bool:
         """
         Establish connections to both source and target databases
@@ -97,24 +258,35 @@ class DatabaseTransfer:
             bool: True if both connections successful, False otherwise
         """
         try:
-            self.source_conn = self._create_connection(self.config['source_db'])
-            self.target_conn = self._create_connection(self.config['target_db'])
+            self._open_connections(self.config['source_db'], self.config['target_db'])
             logger.info("Successfully connected to both databases")
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to databases: {e}")
+            logger.error("Failed to connect to databases: %s", e)
             self._close_connections()
             return False
     
     def _close_connections(self):
-        """Close database connections if they exist"""
-        if self.source_conn and self.source_conn.is_connected():
-            self.source_conn.close()
-            logger.info("Source database connection closed")
+        """Close this thread's database connections if they exist"""
+        # close() raises on a dropped connection with the C extension; the
+        # connection is unusable either way, so log it and carry on
+        if self.source_conn is not None:
+            try:
+                self.source_conn.close()
+                logger.info("Source database connection closed")
+            except Error as e:
+                logger.warning("Error closing source database connection: %s", e)
+            finally:
+                self.source_conn = None
         
-        if self.target_conn and self.target_conn.is_connected():
-            self.target_conn.close()
-            logger.info("Target database connection closed")
+        if self.target_conn is not None:
+            try:
+                self.target_conn.close()
+                logger.info("Target database connection closed")
+            except Error as e:
+                logger.warning("Error closing target database connection: %s", e)
+            finally:
+                self.target_conn = None
     
     def _get_table_structure(self, connection: mysql.connector.MySQLConnection, table_name: str) -> List[Tuple]:
         """
@@ -123,20 +295,24 @@ class DatabaseTransfer:
         Args:
             connection: Database connection
             table_name (str): Name of the table
-            
+        
         Returns:
             List[Tuple]: Table structure information
         """
-        cursor = connection.cursor()
+        key = self._table_key(table_name)
+        if key in self._struct_cache:
+            return self._struct_cache[key]
+        
         try:
-            cursor.execute(f"DESCRIBE {table_name}")
-            return cursor.fetchall()
+            with connection.cursor() as cursor:
+                cursor.execute(f"DESCRIBE {_safe_ident(table_name)}")
+                structure = cursor.fetchall()
+                self._struct_cache[key] = structure
+                return structure
         except Error as e:
-            logger.error(f"Error getting table structure for {table_name}: {e}")
+            logger.error("Error getting table structure for %s: %s", table_name, e)
             raise
-        finally:
-            cursor.close()
-    
+
     def _get_primary_keys(self, connection: mysql.connector.MySQLConnection, table_name: str) -> List[str]:
         """
         Get primary key columns for a table
@@ -144,25 +320,132 @@ class DatabaseTransfer:
         Args:
             connection: Database connection
             table_name (str): Name of the table
-            
+        
         Returns:
             List[str]: List of primary key column names
         """
-        cursor = connection.cursor()
+        key = self._table_key(table_name)
+        if key in self._pk_cache:
+            return self._pk_cache[key]
+        
         try:
-            query = """
-                SELECT COLUMN_NAME 
-                FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE 
-                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND CONSTRAINT_NAME = 'PRIMARY'
-                ORDER BY ORDINAL_POSITION
-            """
-            cursor.execute(query, (connection.database, table_name))
-            return [row[0] for row in cursor.fetchall()]
+            with connection.cursor() as cursor:
+                query = """
+                    SELECT COLUMN_NAME 
+                    FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE 
+                    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND CONSTRAINT_NAME = 'PRIMARY'
+                    ORDER BY ORDINAL_POSITION
+                """
+                cursor.execute(query, (key[2], table_name))
+                primary_keys = [row[0] for row in cursor.fetchall()]
+                self._pk_cache[key] = primary_keys
+                return primary_keys
         except Error as e:
-            logger.error(f"Error getting primary keys for {table_name}: {e}")
+            logger.error("Error getting primary keys for %s: %s", table_name, e)
             raise
-        finally:
-            cursor.close()
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _build_upsert_sql(table_name: str, columns: Tuple[str, ...],
+                          primary_keys: Tuple[str, ...]) -> Tuple[str, str, str]:
+        """
+        Build the column list, update clause and INSERT statement for a table
+        
+        Memoized, so repeated transfers of the same table reuse the strings.
+        
+        Args:
+            table_name (str): Name of the table
+            columns (Tuple[str, ...]): Column names in SELECT order
+            primary_keys (Tuple[str, ...]): Primary key column names
+            
+        Returns:
+            Tuple[str, str, str]: Quoted column list, ON DUPLICATE KEY UPDATE
+                clause ("" when rows are only inserted) and INSERT statement
+        """
+        table = _safe_ident(table_name)
+        placeholders = ', '.join(['%s'] * len(columns))
+        columns_str = ', '.join(_safe_ident(col) for col in columns)
+        
+        # Don't update primary key columns; without a primary key (or with
+        # nothing else to update) duplicates are skipped with IGNORE
+        update_clauses = [
+            f"{_safe_ident(col)} = VALUES({_safe_ident(col)})"
+            for col in columns if col not in primary_keys
+        ]
+        if primary_keys and update_clauses:
+            update_clause = "ON DUPLICATE KEY UPDATE " + ", ".join(update_clauses)
+            insert_query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders}) {update_clause}"
+        else:
+            update_clause = ""
+            insert_query = f"INSERT IGNORE INTO {table} ({columns_str}) VALUES ({placeholders})"
+        
+        return columns_str, update_clause, insert_query
+    
+    @staticmethod
+    def _estimate_row_count(cursor, database_name: str, table_name: str) -> int:
+        """
+        Get a table's row count from INFORMATION_SCHEMA statistics
+        
+        InnoDB only keeps an estimate, but reading it doesn't scan the table.
+        
+        Args:
+            cursor: Cursor on the table's server
+            database_name (str): Name of the database
+            table_name (str): Name of the table
+            
+        Returns:
+            int: Approximate number of rows
+        """
+        return DatabaseTransfer._table_statistics(cursor, database_name, table_name)[0]
+    
+    @staticmethod
+    def _table_statistics(cursor, database_name: str, table_name: str) -> Tuple[int, int]:
+        """
+        Get a table's estimated row count and average row length in bytes
+        
+        Args:
+            cursor: Cursor on the table's server
+            database_name (str): Name of the database
+            table_name (str): Name of the table
+            
+        Returns:
+            Tuple[int, int]: Approximate number of rows and bytes per row
+                (0 when unknown)
+        """
+        cursor.execute("""
+            SELECT TABLE_ROWS, AVG_ROW_LENGTH
+            FROM INFORMATION_SCHEMA.TABLES
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+        """, (database_name, table_name))
+        rows = cursor.fetchall()
+        if not rows:
+            return 0, 0
+        return int(rows[0][0] or 0), int(rows[0][1] or 0)
+    
+    @staticmethod
+    def _table_digest(connection: mysql.connector.MySQLConnection, table_name: str) -> Optional[int]:
+        """
+        Get a table's CHECKSUM TABLE value
+        
+        The checksum covers every row, so equal values on both sides mean
+        there is nothing to copy. It reads the whole table, which is still
+        far cheaper than re-sending it.
+        
+        Args:
+            connection: Database connection
+            table_name (str): Name of the table
+            
+        Returns:
+            Optional[int]: Checksum, or None if it couldn't be computed
+        """
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(f"CHECKSUM TABLE {_safe_ident(table_name)}")
+                row = cursor.fetchone()
+                return row[1] if row else None
+        except Error as e:
+            logger.warning("Could not checksum table %s: %s", table_name, e)
+            return None
     
     def _create_server_connection(self) -> mysql.connector.MySQLConnection:
         """
@@ -172,18 +455,60 @@ class DatabaseTransfer:
             MySQLConnection: Server connection object
         """
         try:
-            connection = mysql.connector.connect(
-                host=self.config['server']['host'],
-                port=self.config['server'].get('port', 3306),
-                user=self.config['server']['user'],
-                password=self.config['server']['password']
-            )
-            logger.info(f"Connected to MySQL server: {self.config['server']['host']}:{self.config['server'].get('port', 3306)}")
+            connection = mysql.connector.connect(**self._connection_args(self.config['server']))
+            logger.info("Connected to MySQL server: %s:%s", self.config['server']['host'], self.config['server'].get('port', 3306))
             return connection
         except Error as e:
-            logger.error(f"Error connecting to MySQL server: {e}")
+            logger.error("Error connecting to MySQL server: %s", e)
             raise
     
+    def _get_server_connection(self) -> mysql.connector.MySQLConnection:
+        """
+        Get a server connection from the connection pool
+        
+        The pool is created on first use. If every pooled connection is
+        busy, a dedicated connection is opened instead so callers never fail
+        just because of concurrency. Use the connection in a with block (or
+        close() it), which returns pooled connections to the pool.
+        
+        Returns:
+            MySQLConnection: Server connection object
+        """
+        with self._server_pool_lock:
+            if self._server_pool is None:
+                self._server_pool = pooling.MySQLConnectionPool(
+                    pool_name="sync",
+                    pool_size=self.pool_size,
+                    # Callers don't rely on session state, so skip the reset
+                    # round trip when a connection is handed out
+                    pool_reset_session=False,
+                    **self._connection_args(self.config['server'])
+                )
+                logger.info("Created server connection pool with %s connections", self.pool_size)
+        
+        try:
+            return self._server_pool.get_connection()
+        except pooling.PoolError:
+            logger.warning("Server connection pool exhausted, opening a dedicated connection")
+            return self._create_server_connection()
+    
+    def close_pool(self):
+        """
+        Close the idle connections of the server connection pool
+        
+        Pooled connections have no finalizer, so an instance that is thrown
+        away would otherwise keep them open. Connections that are checked out
+        stay with their callers. A new pool is created if the instance is
+        used again.
+        """
+        with self._server_pool_lock:
+            server_pool, self._server_pool = self._server_pool, None
+        
+        if server_pool is not None:
+            # The connector has no public call for closing a pool
+            closed = server_pool._remove_connections()
+            logger.info("Closed %s pooled server connections", closed)
+    
     def get_databases(self) -> List[str]:
         """
         Get list of all databases on the MySQL server
@@ -192,23 +517,19 @@ class DatabaseTransfer:
             List[str]: List of database names
         """
         try:
-            if not self.server_conn or not self.server_conn.is_connected():
-                self.server_conn = self._create_server_connection()
-            
-            cursor = self.server_conn.cursor()
-            cursor.execute("SHOW DATABASES")
-            databases = [db[0] for db in cursor.fetchall()]
-            cursor.close()
+            with self._get_server_connection() as conn, conn.cursor() as cursor:
+                cursor.execute("SHOW DATABASES")
+                databases = [db[0] for db in cursor.fetchall()]
             
             # Filter out system databases
             system_dbs = ['information_schema', 'mysql', 'performance_schema', 'sys']
             user_databases = [db for db in databases if db not in system_dbs]
             
-            logger.info(f"Found {len(user_databases)} user databases")
+            logger.info("Found %s user databases", len(user_databases))
             return user_databases
             
         except Error as e:
-            logger.error(f"Error getting databases: {e}")
+            logger.error("Error getting databases: %s", e)
             return []
     
     def get_tables(self, database_name: str) -> List[str]:
@@ -222,20 +543,19 @@ class DatabaseTransfer:
             List[str]: List of table names
         """
         try:
-            if not self.server_conn or not self.server_conn.is_connected():
-                self.server_conn = self._create_server_connection()
-            
-            cursor = self.server_conn.cursor()
-            cursor.execute(f"USE `{database_name}`")
-            cursor.execute("SHOW TABLES")
-            tables = [table[0] for table in cursor.fetchall()]
-            cursor.close()
+            with self._get_server_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES "
+                    "WHERE TABLE_SCHEMA = %s ORDER BY TABLE_NAME",
+                    (database_name,)
+                )
+                tables = [table[0] for table in cursor.fetchall()]
             
-            logger.info(f"Found {len(tables)} tables in database '{database_name}'")
+            logger.info("Found %s tables in database '%s'", len(tables), database_name)
             return tables
             
         except Error as e:
-            logger.error(f"Error getting tables from database '{database_name}': {e}")
+            logger.error("Error getting tables from database '%s': %s", database_name, e)
             return []
     
     def get_table_info(self, database_name: str, table_name: str) -> Dict:
@@ -250,21 +570,18 @@ class DatabaseTransfer:
             Dict: Table information including row count, columns, etc.
         """
         try:
-            if not self.server_conn or not self.server_conn.is_connected():
-                self.server_conn = self._create_server_connection()
-            
-            cursor = self.server_conn.cursor()
-            cursor.execute(f"USE `{database_name}`")
-            
-            # Get row count
-            cursor.execute(f"SELECT COUNT(*) FROM `{table_name}`")
-            row_count = cursor.fetchone()[0]
-            
-            # Get column information
-            cursor.execute(f"DESCRIBE `{table_name}`")
-            columns = cursor.fetchall()
-            
-            cursor.close()
+            with self._get_server_connection() as conn, conn.cursor() as cursor:
+                # Get row count (approximate for InnoDB)
+                row_count = self._estimate_row_count(cursor, database_name, table_name)
+                
+                # Get column information, in DESCRIBE's field order
+                cursor.execute(
+                    "SELECT COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY "
+                    "FROM INFORMATION_SCHEMA.COLUMNS "
+                    "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s ORDER BY ORDINAL_POSITION",
+                    (database_name, table_name)
+                )
+                columns = cursor.fetchall()
             
             return {
                 'database': database_name,
@@ -274,7 +591,38 @@ class DatabaseTransfer:
             }
             
         except Error as e:
-            logger.error(f"Error getting table info for '{database_name}.{table_name}': {e}")
+            logger.error("Error getting table info for '%s.%s': %s", database_name, table_name, e)
+            return {}
+    
+    def get_all_table_info(self, database_name: str) -> Dict[str, Dict]:
+        """
+        Get row counts for every table in a database with a single query
+        
+        Row counts come from INFORMATION_SCHEMA and are estimates for InnoDB
+        tables, which is good enough for listing tables in the UI.
+        
+        Args:
+            database_name (str): Name of the database
+            
+        Returns:
+            Dict[str, Dict]: Table information keyed by table name
+        """
+        try:
+            with self._get_server_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT TABLE_NAME, TABLE_ROWS FROM INFORMATION_SCHEMA.TABLES "
+                    "WHERE TABLE_SCHEMA = %s ORDER BY TABLE_NAME",
+                    (database_name,)
+                )
+                rows = cursor.fetchall()
+            
+            return {
+                table: {'database': database_name, 'table': table, 'row_count': row_count or 0}
+                for table, row_count in rows
+            }
+            
+        except Error as e:
+            logger.error("Error getting table info for database '%s': %s", database_name, e)
             return {}
     
     def transfer_single_table(self, source_db: str, target_db: str, table_name: str) -> Dict:
@@ -289,7 +637,8 @@ class DatabaseTransfer:
         Returns:
             Dict: Transfer statistics
         """
-        logger.info(f"Starting transfer: {source_db}.{table_name} -> {target_db}.{table_name}")
+        logger.info("Starting transfer: %s.%s -> %s.%s", source_db, table_name, target_db, table_name)
+        self._clear_metadata_caches()
         
         # Create database-specific connections
         try:
@@ -309,8 +658,7 @@ class DatabaseTransfer:
                 'password': self.config['server']['password']
             }
             
-            self.source_conn = self._create_connection(source_config)
-            self.target_conn = self._create_connection(target_config)
+            self._open_connections(source_config, target_config)
             
             # Perform the transfer
             result = self.transfer_table_data(table_name)
@@ -318,7 +666,7 @@ class DatabaseTransfer:
             return result
             
         except Exception as e:
-            logger.error(f"Error in single table transfer: {e}")
+            logger.error("Error in single table transfer: %s", e)
             return {
                 "status": "error",
                 "message": f"Transfer failed: {str(e)}"
@@ -326,195 +674,821 @@ class DatabaseTransfer:
         finally:
             self._close_connections()
     
+    def _prefetch_table_metadata(self, table_names: List[str]):
+        """
+        Load column and primary key metadata for many tables in two queries
+        
+        Fills the caches used by _get_table_structure and _get_primary_keys,
+        so each table transfer skips its own metadata round trips. Tables
+        that aren't found are left to be looked up individually.
+        
+        Args:
+            table_names (List[str]): Names of the tables in the source database
+        """
+        database_name = self._source_database()
+        placeholders = ', '.join(['%s'] * len(table_names))
+        params = (database_name, *table_names)
+        
+        try:
+            with self.source_conn.cursor() as cursor:
+                # Same fields as DESCRIBE
+                cursor.execute(f"""
+                    SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, COLUMN_DEFAULT, EXTRA
+                    FROM INFORMATION_SCHEMA.COLUMNS
+                    WHERE TABLE_SCHEMA = %s AND TABLE_NAME IN ({placeholders})
+                    ORDER BY TABLE_NAME, ORDINAL_POSITION
+                """, params)
+                structures: Dict[str, List[Tuple]] = {}
+                for row in cursor.fetchall():
+                    structures.setdefault(row[0], []).append(tuple(row[1:]))
+                
+                cursor.execute(f"""
+                    SELECT TABLE_NAME, COLUMN_NAME
+                    FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+                    WHERE TABLE_SCHEMA = %s AND TABLE_NAME IN ({placeholders}) AND CONSTRAINT_NAME = 'PRIMARY'
+                    ORDER BY TABLE_NAME, ORDINAL_POSITION
+                """, params)
+                primary_keys: Dict[str, List[str]] = {}
+                for table_name, column_name in cursor.fetchall():
+                    primary_keys.setdefault(table_name, []).append(column_name)
+                
+                for table_name, structure in structures.items():
+                    key = self._table_key(table_name)
+                    self._struct_cache[key] = structure
+                    self._pk_cache[key] = primary_keys.get(table_name, [])
+                
+                logger.info("Loaded metadata for %s of %s tables", len(structures), len(table_names))
+        except Error as e:
+            logger.warning("Could not prefetch table metadata: %s", e)
+
+    def _forget_table(self, table_name: str):
+        """
+        Drop cached metadata for a table after an error, since the source
+        definition may have changed
+        
+        Args:
+            table_name (str): Name of the table
+        """
+        key = self._table_key(table_name)
+        self._struct_cache.pop(key, None)
+        self._pk_cache.pop(key, None)
+        self._create_statements.pop(key, None)
+    
+    def _clear_metadata_caches(self):
+        """
+        Drop all cached table metadata
+        
+        Called when a transfer run starts, so a source table altered since
+        the previous run is described afresh.
+        """
+        self._struct_cache.clear()
+        self._pk_cache.clear()
+        self._create_statements.clear()
+    
     def _create_target_table_if_not_exists(self, table_name: str) -> bool:
         """
         Create target table with same structure as source if it doesn't exist
         
         Args:
             table_name (str): Name of the table
-            
+        
         Returns:
             bool: True if successful, False otherwise
         """
-        source_cursor = self.source_conn.cursor()
-        target_cursor = self.target_conn.cursor()
-        
         try:
-            # Get CREATE TABLE statement from source
-            source_cursor.execute(f"SHOW CREATE TABLE {table_name}")
-            create_statement = source_cursor.fetchone()[1]
-            
-            # Check if target table exists
-            target_cursor.execute(f"""
-                SELECT COUNT(*) 
-                FROM INFORMATION_SCHEMA.TABLES 
-                WHERE TABLE_SCHEMA = '{self.target_conn.database}' 
-                AND TABLE_NAME = '{table_name}'
-            """)
-            
-            if target_cursor.fetchone()[0] == 0:
-                # Create table in target database
+            with self.target_conn.cursor() as target_cursor:
+                # Get CREATE TABLE statement from source, once per table
+                key = self._table_key(table_name)
+                create_statement = self._create_statements.get(key)
+                if create_statement is None:
+                    with self.source_conn.cursor() as source_cursor:
+                        source_cursor.execute(f"SHOW CREATE TABLE {_safe_ident(table_name)}")
+                        create_statement = source_cursor.fetchone()[1]
+                    create_statement = re.sub(r'^CREATE TABLE', 'CREATE TABLE IF NOT EXISTS',
+                                              create_statement, count=1)
+                    self._create_statements[key] = create_statement
+                
+                # A no-op (with a warning) when the table already exists
                 target_cursor.execute(create_statement)
                 self.target_conn.commit()
-                logger.info(f"Created table {table_name} in target database")
-            else:
-                logger.info(f"Table {table_name} already exists in target database")
-            
-            return True
-            
+                logger.info("Ensured table %s exists in target database", table_name)
+                
+                return True
+        
         except Error as e:
-            logger.error(f"Error creating target table {table_name}: {e}")
+            logger.error("Error creating target table %s: %s", table_name, e)
             self.target_conn.rollback()
+            self._forget_table(table_name)
             return False
-        finally:
-            source_cursor.close()
-            target_cursor.close()
-    
-    def transfer_table_data(self, table_name: str, batch_size: int = 1000) -> Dict:
+
+    def transfer_table_data(self, table_name: str, batch_size: Optional[int] = None) -> Dict:
         """
         Transfer data from source table to target table
         
         Args:
             table_name (str): Name of the table to transfer
-            batch_size (int): Number of rows to process in each batch
+            batch_size (int, optional): Number of rows to process in each
+                batch; defaults to the 'batch_size' config value. Tables with
+                wide rows use smaller batches so each stays within
+                'batch_bytes'.
             
         Returns:
             Dict: Transfer statistics
         """
-        logger.info(f"Starting data transfer for table: {table_name}")
+        logger.info("Starting data transfer for table: %s", table_name)
         
         # Ensure target table exists
         if not self._create_target_table_if_not_exists(table_name):
             return {"status": "error", "message": "Failed to create target table"}
         
-        source_cursor = self.source_conn.cursor(dictionary=True)
-        target_cursor = self.target_conn.cursor()
+        if self.config.get('skip_if_in_sync', False):
+            source_digest = self._table_digest(self.source_conn, table_name)
+            if source_digest is not None and source_digest == self._table_digest(self.target_conn, table_name):
+                logger.info("Table %s is already in sync, skipping", table_name)
+                # No total_rows: the table isn't empty, its rows just weren't counted
+                return {
+                    "status": "success",
+                    "rows_transferred": 0,
+                    "message": "Already in sync"
+                }
+        
+        bulk_mode = bool(self.config.get('bulk_mode', False))
+        keys_disabled = False
         
         try:
-            # Get table structure
-            table_structure = self._get_table_structure(self.source_conn, table_name)
-            columns = [col[0] for col in table_structure]
-            primary_keys = self._get_primary_keys(self.source_conn, table_name)
+            with self.source_conn.cursor() as source_cursor:
+                # Get table structure
+                table_structure = self._get_table_structure(self.source_conn, table_name)
+                columns = [col[0] for col in table_structure]
+                primary_keys = self._get_primary_keys(self.source_conn, table_name)
+                
+                # Estimate the row count from table statistics; an exact COUNT(*)
+                # would scan the whole table before any row is copied
+                total_rows, avg_row_length = self._table_statistics(
+                    source_cursor, self._source_database(), table_name
+                )
+                logger.info("Total rows to transfer: ~%s (estimated)", total_rows)
+                batch_size = self._batch_rows(table_name, batch_size, avg_row_length)
+                
+                source_cursor.execute(f"SELECT 1 FROM {_safe_ident(table_name)} LIMIT 1")
+                if not source_cursor.fetchall():
+                    return {
+                        "status": "success",
+                        "rows_transferred": 0,
+                        "rows_updated": 0,
+                        "total_rows": 0,
+                        "message": "No data to transfer"
+                    }
+                
+                # Prepare INSERT ... ON DUPLICATE KEY UPDATE statement
+                sql = self._build_upsert_sql(table_name, tuple(columns), tuple(primary_keys))
+                
+                # On a shared server and login the rows never need to leave it
+                server_side = self._same_server()
+                ranges = [] if server_side else self._partition_ranges(
+                    source_cursor, table_name, table_structure, primary_keys
+                )
             
-            # Count total rows in source table
-            source_cursor.execute(f"SELECT COUNT(*) as count FROM {table_name}")
-            total_rows = source_cursor.fetchone()['count']
-            logger.info(f"Total rows to transfer: {total_rows}")
+            if bulk_mode:
+                keys_disabled = self._alter_keys(table_name, 'DISABLE')
             
-            if total_rows == 0:
+            if server_side:
+                logger.info("Copying %s on the server with INSERT ... SELECT", table_name)
+                rows_affected = self._copy_server_side(table_name, sql)
+                logger.info("Data transfer completed for table %s", table_name)
+                
+                # MySQL's affected-rows count is not a row count: an updated
+                # row counts twice and an unchanged one not at all
                 return {
                     "status": "success",
-                    "rows_transferred": 0,
-                    "rows_updated": 0,
-                    "total_rows": 0,
-                    "message": "No data to transfer"
+                    "rows_affected": rows_affected,
+                    "message": f"Copied on the server ({rows_affected} rows affected)"
                 }
             
-            # Prepare INSERT ... ON DUPLICATE KEY UPDATE statement
-            placeholders = ', '.join(['%s'] * len(columns))
-            columns_str = ', '.join([f"`{col}`" for col in columns])
-            
-            if primary_keys:
-                # Create ON DUPLICATE KEY UPDATE clause
-                update_clauses = []
-                for col in columns:
-                    if col not in primary_keys:  # Don't update primary key columns
-                        update_clauses.append(f"`{col}` = VALUES(`{col}`)")
-                
-                if update_clauses:
-                    update_clause = "ON DUPLICATE KEY UPDATE " + ", ".join(update_clauses)
-                else:
-                    update_clause = ""
+            if ranges:
+                # Each range has its own connections and disjoint keys, so the
+                # upserts can't conflict
+                logger.info("Transferring %s in %s primary key ranges", table_name, len(ranges))
+                db_configs = self._local.db_configs
+                with ThreadPoolExecutor(max_workers=len(ranges),
+                                        thread_name_prefix='partition') as executor:
+                    futures = [
+                        executor.submit(self._transfer_partition, table_name, db_configs, sql,
+                                        batch_size, primary_keys[0], low, high, total_rows // len(ranges))
+                        for low, high in ranges
+                    ]
+                    rows_transferred = sum(future.result() for future in futures)
             else:
-                # If no primary key, use IGNORE to skip duplicates
-                update_clause = ""
-                insert_type = "INSERT IGNORE"
+                rows_transferred = self._copy_rows(table_name, sql, batch_size, total_rows=total_rows)
             
-            if primary_keys and update_clauses:
-                insert_query = f"INSERT INTO `{table_name}` ({columns_str}) VALUES ({placeholders}) {update_clause}"
-            else:
-                insert_query = f"INSERT IGNORE INTO `{table_name}` ({columns_str}) VALUES ({placeholders})"
+            logger.info("Data transfer completed for table %s", table_name)
+            
+            # Every row has been read by now, so the exact count is known
+            return {
+                "status": "success",
+                "rows_transferred": rows_transferred,
+                "total_rows": rows_transferred,
+                "message": f"Successfully transferred {rows_transferred} rows"
+            }
             
-            # Transfer data in batches
-            offset = 0
+        except Error as e:
+            logger.error("Error transferring data for table %s: %s", table_name, e)
+            self.target_conn.rollback()
+            self._forget_table(table_name)
+            return {
+                "status": "error",
+                "message": f"Error transferring data: {str(e)}"
+            }
+        finally:
+            if keys_disabled:
+                self._alter_keys(table_name, 'ENABLE')
+    
+    def _batch_rows(self, table_name: str, batch_size: Optional[int], avg_row_length: int) -> int:
+        """
+        Work out how many rows go into each batch of a table
+        
+        Args:
+            table_name (str): Name of the table
+            batch_size (int, optional): Requested rows per batch; None for
+                the 'batch_size' config value
+            avg_row_length (int): Average row length in bytes from the table
+                statistics, 0 when unknown
+        
+        Returns:
+            int: Rows per batch
+        """
+        if batch_size is None:
+            batch_size = int(self.config.get('batch_size', DEFAULT_BATCH_SIZE))
+        batch_size = max(1, batch_size)
+        
+        if avg_row_length > 0:
+            batch_bytes = int(self.config.get('batch_bytes', DEFAULT_BATCH_BYTES))
+            fitting_rows = max(1, batch_bytes // avg_row_length)
+            if fitting_rows < batch_size:
+                logger.info("Using batches of %s rows for %s (~%s bytes per row)",
+                            fitting_rows, table_name, avg_row_length)
+                batch_size = fitting_rows
+        
+        return batch_size
+    
+    def _copy_rows(self, table_name: str, sql: Tuple[str, str, str], batch_size: int,
+                   where: str = "", params: Tuple = (), total_rows: int = 0) -> int:
+        """
+        Stream rows from the source table into the target table on this
+        thread's connections
+        
+        Args:
+            table_name (str): Name of the table
+            sql (Tuple[str, str, str]): Output of _build_upsert_sql
+            batch_size (int): Number of rows to process in each batch
+            where (str): Optional WHERE clause limiting the rows copied
+            params (Tuple): Parameters for the WHERE clause
+            total_rows (int): Estimated row count, for progress logging
+            
+        Returns:
+            int: Number of rows copied
+        """
+        columns_str, update_clause, insert_query = sql
+        table = _safe_ident(table_name)
+        
+        # Committing every few batches rather than every batch saves a log
+        # flush per batch
+        commit_every = max(1, int(self.config.get('commit_every', DEFAULT_COMMIT_EVERY)))
+        
+        # Unbuffered, so rows stream from the server as they are fetched.
+        # Plain tuples already match the INSERT column order.
+        source_cursor = self.source_conn.cursor(buffered=False)
+        target_cursor = self.target_conn.cursor()
+        producer = None
+        staging_table = None
+        bulk_settings = None
+        
+        try:
+            # LOAD DATA skips per-row statement parsing. It can only ignore
+            # duplicates, so upserts go through a staging table first.
+            load_query = None
+            merge_query = None
+            if self.config.get('load_data_infile', False):
+                load_target = table
+                if update_clause:
+                    load_target = staging_table = _safe_ident(f"_staging_{table_name}"[:64])
+                    target_cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {staging_table}")
+                    target_cursor.execute(f"CREATE TEMPORARY TABLE {staging_table} LIKE {table}")
+                    merge_query = (f"INSERT INTO {table} ({columns_str}) "
+                                   f"SELECT {columns_str} FROM {staging_table} {update_clause}")
+                load_query = (f"LOAD DATA LOCAL INFILE %s IGNORE INTO TABLE {load_target} "
+                              f"CHARACTER SET utf8mb4 ({columns_str})")
+            
+            # Transfer data in batches, reading the source table in a single
+            # scan instead of re-scanning it with LIMIT/OFFSET for every batch
             rows_transferred = 0
-            rows_updated = 0
+            uncommitted_batches = 0
             
-            while offset < total_rows:
-                # Fetch batch from source
-                source_cursor.execute(f"SELECT * FROM {table_name} LIMIT {batch_size} OFFSET {offset}")
-                batch = source_cursor.fetchall()
+            # The producer stops reading while the batch queue is full; give
+            # a slow target time to catch up before the server gives up on
+            # the stalled stream (net_write_timeout defaults to 60 seconds)
+            source_cursor.execute("SET SESSION net_write_timeout = %s",
+                                  (int(self.config.get('net_write_timeout', DEFAULT_NET_WRITE_TIMEOUT)),))
+            source_cursor.execute(f"SELECT {columns_str} FROM {table} {where}", params)
+            
+            if self.config.get('bulk_mode', False):
+                bulk_settings = self._enter_bulk_mode(target_cursor)
+            
+            # Fetch batches on a separate thread so reading the next batch
+            # from the source overlaps with writing the current one
+            batches = queue.Queue(maxsize=4)
+            stop = threading.Event()
+            producer = threading.Thread(
+                target=self._produce_batches,
+                args=(source_cursor, batch_size, batches, stop),
+                daemon=True
+            )
+            producer.start()
+            
+            while True:
+                batch = batches.get()
                 
-                if not batch:
+                if batch is None:
                     break
-                
-                # Prepare data for insertion
-                batch_data = []
-                for row in batch:
-                    batch_data.append([row[col] for col in columns])
+                if isinstance(batch, Exception):
+                    raise batch
                 
                 # Insert batch into target
-                target_cursor.executemany(insert_query, batch_data)
+                if load_query:
+                    self._load_batch(target_cursor, load_query, batch)
+                    if merge_query:
+                        target_cursor.execute(merge_query)
+                        target_cursor.execute(f"DELETE FROM {staging_table}")
+                else:
+                    target_cursor.executemany(insert_query, batch)
                 
-                # Get affected rows count
-                affected_rows = target_cursor.rowcount
-                rows_transferred += len(batch_data)
+                rows_transferred += len(batch)
                 
-                # Commit batch
+                uncommitted_batches += 1
+                if uncommitted_batches >= commit_every:
+                    self.target_conn.commit()
+                    uncommitted_batches = 0
+                    # One progress line per commit rather than per batch
+                    logger.info("Processed batch: %s/~%s rows", rows_transferred, total_rows)
+                else:
+                    logger.debug("Processed batch: %s/~%s rows", rows_transferred, total_rows)
+            
+            if uncommitted_batches:
                 self.target_conn.commit()
-                
-                logger.info(f"Processed batch: {offset + len(batch)}/{total_rows} rows")
-                offset += batch_size
             
-            logger.info(f"Data transfer completed for table {table_name}")
+            return rows_transferred
             
-            return {
-                "status": "success",
-                "rows_transferred": rows_transferred,
-                "total_rows": total_rows,
-                "message": f"Successfully transferred {rows_transferred} rows"
-            }
+        except Error:
+            self.target_conn.rollback()
+            raise
+        finally:
+            if producer is not None:
+                stop.set()
+                producer.join()
+            try:
+                source_cursor.close()
+            except Error:
+                # A failed transfer can leave unread rows on the stream, which
+                # would break the next query on this connection. Reconnecting
+                # discards them without reading the rest of the table.
+                self.source_conn.reconnect()
+            if staging_table:
+                try:
+                    target_cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {staging_table}")
+                except Error:
+                    pass
+            if bulk_settings is not None:
+                self._exit_bulk_mode(target_cursor, bulk_settings)
+            target_cursor.close()
+    
+    def _same_server(self) -> bool:
+        """
+        Check whether this thread's source and target databases share a
+        server and login, so one connection can read both
+        
+        Only enabled when 'server_side_copy' is true in the config: the copy
+        is one statement, so it ignores batch_size, commit_every,
+        partition_parallelism and load_data_infile and holds its locks on
+        the source rows until it finishes.
+        
+        Returns:
+            bool: True if a server-side copy is possible
+        """
+        db_configs = getattr(self._local, 'db_configs', None)
+        if db_configs is None or not self.config.get('server_side_copy', False):
+            return False
+        
+        source_config, target_config = db_configs
+        return (source_config['host'] == target_config['host']
+                and source_config.get('port', 3306) == target_config.get('port', 3306)
+                and source_config['user'] == target_config['user'])
+    
+    def _copy_server_side(self, table_name: str, sql: Tuple[str, str, str]) -> int:
+        """
+        Copy a table with a single cross-database INSERT ... SELECT run on
+        the target connection
+        
+        Args:
+            table_name (str): Name of the table
+            sql (Tuple[str, str, str]): Output of _build_upsert_sql
             
+        Returns:
+            int: Rows affected, as reported by MySQL (an updated row counts
+                twice, an unchanged one not at all)
+        """
+        columns_str, update_clause, _ = sql
+        insert_type = "INSERT" if update_clause else "INSERT IGNORE"
+        source_table = f"{_safe_ident(self._source_database())}.{_safe_ident(table_name)}"
+        query = (f"{insert_type} INTO {_safe_ident(table_name)} ({columns_str}) "
+                 f"SELECT {columns_str} FROM {source_table} {update_clause}")
+        
+        bulk_settings = None
+        with self.target_conn.cursor() as cursor:
+            try:
+                if self.config.get('bulk_mode', False):
+                    bulk_settings = self._enter_bulk_mode(cursor)
+                
+                cursor.execute(query)
+                self.target_conn.commit()
+                return cursor.rowcount
+            finally:
+                if bulk_settings is not None:
+                    self._exit_bulk_mode(cursor, bulk_settings)
+    
+    def _partition_ranges(self, cursor, table_name: str, table_structure: List[Tuple],
+                          primary_keys: List[str]) -> List[Tuple[int, int]]:
+        """
+        Split a table into primary key ranges for parallel copying
+        
+        Only tables with a single integer primary key are split, and only
+        when the 'partition_parallelism' config value is above 1.
+        
+        Args:
+            cursor: Source cursor
+            table_name (str): Name of the table
+            table_structure (List[Tuple]): DESCRIBE output for the table
+            primary_keys (List[str]): Primary key column names
+            
+        Returns:
+            List[Tuple[int, int]]: Inclusive (low, high) key ranges, or an
+                empty list to copy the table in one pass
+        """
+        partitions = min(int(self.config.get('partition_parallelism', 1)), MAX_PARTITIONS)
+        if partitions < 2 or len(primary_keys) != 1:
+            return []
+        if getattr(self._local, 'db_configs', None) is None:
+            return []
+        
+        pk = primary_keys[0]
+        pk_type = next(col[1] for col in table_structure if col[0] == pk)
+        if isinstance(pk_type, (bytes, bytearray)):
+            pk_type = pk_type.decode('utf-8')
+        if not re.match(r'(tiny|small|medium|big)?int\b', pk_type.lower()):
+            return []
+        
+        cursor.execute(f"SELECT MIN({_safe_ident(pk)}), MAX({_safe_ident(pk)}) FROM {_safe_ident(table_name)}")
+        low, high = cursor.fetchone()
+        if low is None:
+            return []
+        
+        step = -(-(high - low + 1) // partitions)
+        return [
+            (start, min(start + step - 1, high))
+            for start in range(low, high + 1, step)
+        ]
+    
+    def _transfer_partition(self, table_name: str, db_configs: Tuple[Dict, Dict],
+                            sql: Tuple[str, str, str], batch_size: int, pk: str,
+                            low: int, high: int, total_rows: int) -> int:
+        """
+        Copy one primary key range of a table on its own connection pair
+        
+        Runs on a partition worker thread.
+        
+        Args:
+            table_name (str): Name of the table
+            db_configs (Tuple[Dict, Dict]): Source and target connection settings
+            sql (Tuple[str, str, str]): Output of _build_upsert_sql
+            batch_size (int): Number of rows to process in each batch
+            pk (str): Primary key column
+            low (int): First key in the range
+            high (int): Last key in the range
+            total_rows (int): Estimated row count of the range
+            
+        Returns:
+            int: Number of rows copied
+        """
+        try:
+            self._open_connections(*db_configs)
+            return self._copy_rows(table_name, sql, batch_size,
+                                   where=f"WHERE {_safe_ident(pk)} BETWEEN %s AND %s",
+                                   params=(low, high), total_rows=total_rows)
+        finally:
+            self._close_connections()
+    
+    def _alter_keys(self, table_name: str, action: str) -> bool:
+        """
+        Disable or re-enable non-unique keys on the target table
+        
+        Only MyISAM honours this; InnoDB ignores it with a warning.
+        
+        Args:
+            table_name (str): Name of the table
+            action (str): 'DISABLE' or 'ENABLE'
+        
+        Returns:
+            bool: True if the statement succeeded
+        """
+        try:
+            with self.target_conn.cursor() as cursor:
+                cursor.execute(f"ALTER TABLE {_safe_ident(table_name)} {action} KEYS")
+                return True
         except Error as e:
-            logger.error(f"Error transferring data for table {table_name}: {e}")
-            self.target_conn.rollback()
+            logger.warning("Could not %s keys on %s: %s", action.lower(), table_name, e)
+            return False
+
+    def _enter_bulk_mode(self, cursor) -> Dict[str, int]:
+        """
+        Switch off per-row checks on the target session for a bulk load
+        
+        Each setting is changed on its own, so one that needs privileges the
+        user lacks (sql_log_bin needs SUPER) doesn't block the others.
+        
+        Args:
+            cursor: Target cursor
+            
+        Returns:
+            Dict[str, int]: Previous values of the settings that were changed
+        """
+        saved = {}
+        for setting in BULK_MODE_SETTINGS:
+            try:
+                cursor.execute(f"SELECT @@SESSION.{setting}")
+                previous = cursor.fetchone()[0]
+                cursor.execute(f"SET SESSION {setting} = 0")
+                saved[setting] = previous
+            except Error as e:
+                logger.warning("Could not disable %s for bulk load: %s", setting, e)
+        
+        return saved
+    
+    def _exit_bulk_mode(self, cursor, saved: Dict[str, int]):
+        """
+        Restore the session settings changed by _enter_bulk_mode
+        
+        Args:
+            cursor: Target cursor
+            saved (Dict[str, int]): Previous setting values
+        """
+        for setting, previous in saved.items():
+            try:
+                cursor.execute(f"SET SESSION {setting} = %s", (previous,))
+            except Error as e:
+                logger.warning("Could not restore %s after bulk load: %s", setting, e)
+    
+    @staticmethod
+    def _infile_field(value) -> bytes:
+        """
+        Encode one value as a LOAD DATA field using the default escaping
+        (tab-separated, backslash-escaped, \\N for NULL)
+        
+        Args:
+            value: Column value as returned by the connector
+            
+        Returns:
+            bytes: Escaped field
+        """
+        if value is None:
+            return b'\\N'
+        if isinstance(value, bool):
+            return b'1' if value else b'0'
+        if isinstance(value, (bytes, bytearray)):
+            data = bytes(value)
+        elif isinstance(value, timedelta):
+            # TIME columns; str() would give "1 day, 2:00:00"
+            sign = '-' if value < timedelta(0) else ''
+            total = abs(value)
+            minutes, seconds = divmod(total.days * 86400 + total.seconds, 60)
+            hours, minutes = divmod(minutes, 60)
+            data = f"{sign}{hours}:{minutes:02d}:{seconds:02d}.{total.microseconds:06d}".encode('utf-8')
+        elif isinstance(value, (set, frozenset)):
+            data = ','.join(sorted(value)).encode('utf-8')
+        else:
+            data = str(value).encode('utf-8')
+        return (data.replace(b'\\', b'\\\\')
+                    .replace(b'\t', b'\\t')
+                    .replace(b'\n', b'\\n')
+                    .replace(b'\r', b'\\r')
+                    .replace(b'\0', b'\\0'))
+    
+    def _load_batch(self, cursor, load_query: str, batch: List[Tuple]):
+        """
+        Write a batch to a temporary file and send it with LOAD DATA LOCAL INFILE
+        
+        Args:
+            cursor: Target cursor
+            load_query (str): LOAD DATA statement with a %s file placeholder
+            batch (List[Tuple]): Rows in column order
+        """
+        fd, path = tempfile.mkstemp(suffix='.tsv')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for row in batch:
+                    f.write(b'\t'.join(self._infile_field(value) for value in row))
+                    f.write(b'\n')
+            cursor.execute(load_query, (path,))
+        finally:
+            os.unlink(path)
+    
+    @staticmethod
+    def _produce_batches(source_cursor, batch_size: int, batches: queue.Queue, stop: threading.Event):
+        """
+        Read batches from a source cursor into a queue (producer thread)
+        
+        The queue receives each batch, then None at the end of the data, or
+        the exception that stopped the read. Only this thread uses the
+        source connection while it runs.
+        
+        Args:
+            source_cursor: Cursor with an executed SELECT
+            batch_size (int): Number of rows per batch
+            batches (queue.Queue): Bounded queue shared with the consumer
+            stop (threading.Event): Set by the consumer to abort the read
+        """
+        def put(item) -> bool:
+            # Don't block forever if the consumer has given up
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        try:
+            while not stop.is_set():
+                batch = source_cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                if not put(batch):
+                    return
+        except Exception as e:
+            put(e)
+            return
+        put(None)
+    
+    def _transfer_one(self, table_name: str,
+                      on_table_start: Optional[Callable[[str], None]] = None) -> Dict:
+        """
+        Transfer one configured table on this thread's connection pair
+        
+        The connections are opened on first use and left open for the next
+        table; they are only dropped after an unexpected error, so the
+        next table starts from a clean session.
+        
+        Args:
+            table_name (str): Name of the table
+            on_table_start (Callable, optional): Called with the table name
+                once the connections are open
+        
+        Returns:
+            Dict: Transfer statistics
+        """
+        if self.source_conn is None and not self.connect_databases():
+            return {"status": "error", "message": "Failed to connect to databases"}
+        
+        try:
+            logger.info("Transferring table: %s", table_name)
+            if on_table_start:
+                on_table_start(table_name)
+            
+            return self.transfer_table_data(table_name)
+        except Exception as e:
+            logger.error("Unexpected error transferring table %s: %s", table_name, e)
+            self._close_connections()
             return {
                 "status": "error",
-                "message": f"Error transferring data: {str(e)}"
+                "message": f"Unexpected error: {str(e)}"
             }
+    
+    def _transfer_worker(self, pending: queue.Queue, done: queue.Queue,
+                         on_table_start: Optional[Callable[[str], None]] = None):
+        """
+        Transfer tables from a queue until it is empty
+        
+        Runs on a transfer_all_tables worker thread. The connections are
+        thread-local, so each worker connects once and reuses its pair for
+        every table it takes.
+        
+        Args:
+            pending (queue.Queue): Names of the tables still to transfer
+            done (queue.Queue): Receives a (table name, result) pair per table
+            on_table_start (Callable, optional): Called with the table name
+                before each table is transferred
+        """
+        try:
+            while True:
+                try:
+                    table_name = pending.get_nowait()
+                except queue.Empty:
+                    return
+                
+                # Always answer for a taken table, or the caller waits for it
+                result = {"status": "error", "message": "Transfer worker stopped unexpectedly"}
+                try:
+                    result = self._transfer_one(table_name, on_table_start)
+                except Exception as e:
+                    logger.error("Unexpected error transferring table %s: %s", table_name, e)
+                    result = {"status": "error", "message": f"Unexpected error: {str(e)}"}
+                finally:
+                    done.put((table_name, result))
         finally:
-            source_cursor.close()
-            target_cursor.close()
+            self._close_connections()
     
-    def transfer_all_tables(self) -> Dict:
+    def transfer_all_tables(self,
+                            on_table_start: Optional[Callable[[str], None]] = None,
+                            on_table_done: Optional[Callable[[str, Dict], None]] = None) -> Dict:
         """
         Transfer data from all configured tables
         
+        Tables are copied one at a time in configuration order unless the
+        'parallel_tables' config value (at most MAX_PARALLEL_TABLES) allows
+        more. Concurrent tables finish in any order, so a child table may be
+        copied before the parent its foreign keys point to.
+        
+        Args:
+            on_table_start (Callable, optional): Called with the table name
+                before each table is transferred
+            on_table_done (Callable, optional): Called with the table name and
+                its result after each table is transferred
+        
         Returns:
             Dict: Overall transfer results
         """
+        self._clear_metadata_caches()
+        
+        # Checks the connection settings up front and loads table metadata;
+        # every worker then opens its own source/target pair
         if not self.connect_databases():
             return {"status": "error", "message": "Failed to connect to databases"}
         
-        tables_to_transfer = self.config.get('tables', [])
+        # A table listed twice would otherwise be copied by two workers at once
+        tables_to_transfer = list(dict.fromkeys(self.config.get('tables', [])))
         if not tables_to_transfer:
+            self._close_connections()
             return {"status": "error", "message": "No tables specified in configuration"}
         
+        self._prefetch_table_metadata(tables_to_transfer)
+        self._close_connections()
+        
+        parallel_tables = int(self.config.get('parallel_tables', 1))
+        parallel_tables = max(1, min(parallel_tables, MAX_PARALLEL_TABLES, len(tables_to_transfer)))
+        
         results = {}
         overall_success = True
         
         try:
             start_time = datetime.now()
-            logger.info(f"Starting bulk transfer of {len(tables_to_transfer)} tables")
+            logger.info("Starting bulk transfer of %s tables (%s in parallel)",
+                        len(tables_to_transfer), parallel_tables)
             
+            pending = queue.Queue()
             for table_name in tables_to_transfer:
-                logger.info(f"Transferring table: {table_name}")
-                result = self.transfer_table_data(table_name)
-                results[table_name] = result
+                pending.put(table_name)
+            done = queue.Queue()
+            
+            with ThreadPoolExecutor(max_workers=parallel_tables,
+                                    thread_name_prefix='transfer') as executor:
+                workers = [
+                    executor.submit(self._transfer_worker, pending, done, on_table_start)
+                    for _ in range(parallel_tables)
+                ]
+                
+                while len(results) < len(tables_to_transfer):
+                    try:
+                        table_name, result = done.get(timeout=1)
+                    except queue.Empty:
+                        if not all(worker.done() for worker in workers) or not done.empty():
+                            continue
+                        # Every worker has exited, so the rest will never arrive
+                        table_name = next(name for name in tables_to_transfer if name not in results)
+                        result = {"status": "error", "message": "Transfer worker stopped before this table"}
+                    
+                    results[table_name] = result
+                    
+                    if on_table_done:
+                        on_table_done(table_name, result)
+                    
+                    if result['status'] != 'success':
+                        overall_success = False
+                        logger.error("Failed to transfer table %s: %s", table_name, result['message'])
                 
-                if result['status'] != 'success':
-                    overall_success = False
-                    logger.error(f"Failed to transfer table {table_name}: {result['message']}")
+                for worker in workers:
+                    if worker.exception() is not None:
+                        logger.error("Transfer worker failed: %s", worker.exception())
+            
+            # Report in configuration order rather than completion order
+            results = {table_name: results[table_name] for table_name in tables_to_transfer}
             
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
@@ -528,7 +1502,7 @@ class DatabaseTransfer:
             }
             
         except Exception as e:
-            logger.error(f"Unexpected error during bulk transfer: {e}")
+            logger.error("Unexpected error during bulk transfer: %s", e)
             return {
                 "status": "error",
                 "message": f"Unexpected error: {str(e)}"
@@ -540,8 +1514,8 @@ class DatabaseTransfer:
 def main():
     """Main function for standalone script execution"""
     try:
-        transfer = DatabaseTransfer()
-        result = transfer.transfer_all_tables()
+        with DatabaseTransfer() as transfer:
+            result = transfer.transfer_all_tables()
         
         print("\n" + "="*50)
         print("TRANSFER RESULTS")
@@ -560,7 +1534,7 @@ def main():
         return result['status'] == 'success'
         
     except Exception as e:
-        logger.error(f"Script execution failed: {e}")
+        logger.error("Script execution failed: %s", e)
         print(f"ERROR: {e}")
         return False
 
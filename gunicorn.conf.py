@@ -0,0 +1,28 @@
+"""
+Gunicorn configuration for the MySQL Database Transfer web app
+--------------------------------------------------------------
+Start with: gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+
+bind = f"{os.environ.get('HOST', '127.0.0.1')}:{os.environ.get('PORT', 5000)}"
+
+# The job registry, progress streams and metadata caches live in process
+# memory, so every request for a job has to reach the worker that started
+# it. Scale with threads; only raise the worker count behind sticky sessions.
+workers = int(os.environ.get('GUNICORN_WORKERS', 1))
+worker_class = 'gthread'
+
+# Each open progress stream holds a thread for as long as the page is open,
+# and requests mostly wait on MySQL, so the default doesn't follow the CPU
+# count: a few watching tabs would otherwise use up a small host's threads
+threads = int(os.environ.get('GUNICORN_THREADS', 32))
+
+# Split the MySQL connection pool between workers. The app is not preloaded,
+# so each worker creates its own pool lazily after the fork.
+preload_app = False
+pool_size = int(os.environ.get('POOL_SIZE', 10))
+raw_env = [f"POOL_SIZE={max(1, pool_size // workers)}"]
+
+accesslog = '-'
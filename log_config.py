@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Logging setup shared by the web app and the transfer script
+-----------------------------------------------------------
+Both log to stdout and to transfer.log. File writes are buffered and flushed
+every 1000 records or on the first error, instead of once per record.
+"""
+
+import logging
+import sys
+from logging.handlers import MemoryHandler, RotatingFileHandler
+
+LOG_FILE = 'transfer.log'
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+def configure_logging():
+    """Set up the root logger once; later calls are no-ops"""
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    
+    file_handler = RotatingFileHandler(LOG_FILE, maxBytes=50_000_000, backupCount=5, delay=True)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[
+            MemoryHandler(1000, flushLevel=logging.ERROR, target=file_handler),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
@@ -66,4 +66,8 @@ echo "Open your browser and navigate to: http://localhost:5000"
 echo "Press Ctrl+C to stop the server"
 echo
 
-python app.py
+if command -v gunicorn &> /dev/null; then
+    gunicorn -c gunicorn.conf.py app:app
+else
+    python app.py
+fi